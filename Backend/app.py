@@ -1,12 +1,12 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 from flask import Flask, request, jsonify
 from werkzeug.utils import secure_filename
 from flask_cors import CORS
 import os
 import geocoder
-import time
-import torch
-from ultralytics import YOLO
-from threading import Thread
+from threading import Thread, Event, Lock
 import json
 from datetime import datetime
 
@@ -27,10 +27,89 @@ os.makedirs(PROCESSED_FOLDER, exist_ok=True)
 os.makedirs(RESULTS_FOLDER, exist_ok=True)
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# ✅ Set MODEL_PRELOAD=1 to load the weights synchronously at import, e.g. in a
+# gunicorn --preload parent so forked workers share them via copy-on-write
+# (see gunicorn.conf.py). The warm-up pass always runs in the worker itself.
+MODEL_PRELOAD = os.environ.get("MODEL_PRELOAD", "0") == "1"
+MODEL_WAIT_TIMEOUT = float(os.environ.get("MODEL_WAIT_TIMEOUT", "300"))
+
+
 # ===========================
-# ✅ Load YOLOv8 Model
+# ✅ Load YOLOv8 Model (Lazy, in Background)
 # ===========================
-model = YOLO(MODEL_PATH)
+model = None
+model_error = None
+model_ready = Event()
+_model_lock = Lock()
+_loader_thread = None
+startup_timings = {}
+
+
+def load_model():
+    """Imports ultralytics and loads the YOLOv8 weights without running inference."""
+    global model, model_error
+    with _model_lock:
+        if model is not None or model_error is not None:
+            return model
+        try:
+            t0 = time.perf_counter()
+            from ultralytics import YOLO
+            t1 = time.perf_counter()
+            loaded = YOLO(MODEL_PATH)
+            t2 = time.perf_counter()
+
+            startup_timings['model_import_seconds'] = round(t1 - t0, 3)
+            startup_timings['model_load_seconds'] = round(t2 - t1, 3)
+            model = loaded
+            print(f"✅ Model weights loaded: {startup_timings}")
+        except Exception as e:
+            model_error = str(e)
+            print(f"Model Load Error: {e}")
+    return model
+
+
+def warm_model():
+    """Loads the model if needed, runs one warm-up pass and marks this process ready.
+
+    Torch starts its OpenMP thread pool on the first inference, so this must
+    run after any fork, never in a preforking parent.
+    """
+    global model_error
+    try:
+        if load_model() is not None:
+            with _model_lock:
+                import numpy as np
+                t0 = time.perf_counter()
+                model(np.zeros((640, 640, 3), dtype=np.uint8), verbose=False)
+                startup_timings['model_warmup_seconds'] = round(time.perf_counter() - t0, 3)
+            print(f"✅ Model ready (pid {os.getpid()}): {startup_timings}")
+    except Exception as e:
+        model_error = str(e)
+        print(f"Model Warm-up Error: {e}")
+    finally:
+        model_ready.set()
+
+
+def start_model_loader():
+    """Starts loading/warming the model in a daemon thread (once per process)."""
+    global _loader_thread
+    if _loader_thread is None and not model_ready.is_set():
+        _loader_thread = Thread(target=warm_model, daemon=True)
+        _loader_thread.start()
+
+
+def _reset_after_fork():
+    # ✅ Threads don't survive fork: drop the parent's loader state (its lock
+    # may even be held) and warm the inherited weights in this worker.
+    global _model_lock, _loader_thread, model_ready
+    _model_lock = Lock()
+    _loader_thread = None
+    model_ready = Event()
+    start_model_loader()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
 # ===========================
@@ -50,6 +129,11 @@ def get_geolocation():
 # ✅ Process Image & Detect Objects
 # ===========================
 def process_image(file_path, filename):
+    # ✅ Uploads accepted during startup wait here until the model is warm
+    if not model_ready.wait(MODEL_WAIT_TIMEOUT) or model_error is not None:
+        print(f"Skipping {filename}: model not available ({model_error or 'still loading'})")
+        return None
+
     results = model(file_path)  # Run YOLOv8 object detection
     detected_objects = []
 
@@ -98,6 +182,32 @@ def home():
     return jsonify({"message": "Welcome to Eco Vision AR API!"}), 200
 
 
+# ===========================
+# ✅ Liveness & Readiness Routes
+# ===========================
+@app.route('/health')
+def health():
+    return jsonify({
+        'status': 'ok',
+        'uptime_seconds': round(time.perf_counter() - _IMPORT_START, 3)
+    }), 200
+
+
+@app.route('/ready')
+def ready():
+    if model_error is not None:
+        status, code = 'failed', 503
+    elif model_ready.is_set():
+        status, code = 'ready', 200
+    else:
+        status, code = 'loading', 503
+
+    body = {'status': status, 'timings': startup_timings}
+    if model_error is not None:
+        body['error'] = model_error
+    return jsonify(body), code
+
+
 # ===========================
 # ✅ Upload & Process API Route
 # ===========================
@@ -110,6 +220,11 @@ def upload_image():
     if file.filename == '':
         return jsonify({'error': 'No selected file'}), 400
 
+    if model_error is not None:
+        return jsonify({'error': f'Model unavailable: {model_error}'}), 503
+
+    loading = not model_ready.is_set()
+
     # ✅ Secure & Save File Locally
     filename = secure_filename(file.filename)
     file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
@@ -119,6 +234,14 @@ def upload_image():
     thread = Thread(target=process_image, args=(file_path, filename))
     thread.start()
 
+    # ✅ Still warming up: the file is saved and will be processed once ready
+    if loading:
+        return jsonify({
+            'message': '✅ File uploaded successfully! Model is loading, processing deferred...',
+            'filename': filename,
+            'status': 'loading'
+        }), 202
+
     return jsonify({
         'message': '✅ File uploaded successfully! Processing started...',
         'filename': filename
@@ -162,12 +285,14 @@ def monitor_folder():
     processed_files = set()
 
     while True:
-        for filename in os.listdir(UPLOAD_FOLDER):
-            file_path = os.path.join(UPLOAD_FOLDER, filename)
-            if filename not in processed_files and os.path.isfile(file_path):
-                print(f"🟢 New image detected: {filename}")
-                process_image(file_path, filename)
-                processed_files.add(filename)
+        # ✅ Don't block the scan on a cold model; the next scan retries
+        if model_ready.is_set() and model_error is None:
+            for filename in os.listdir(UPLOAD_FOLDER):
+                file_path = os.path.join(UPLOAD_FOLDER, filename)
+                if filename not in processed_files and os.path.isfile(file_path):
+                    print(f"🟢 New image detected: {filename}")
+                    if process_image(file_path, filename) is not None:
+                        processed_files.add(filename)
         time.sleep(5)  # ✅ Check every 5 seconds
 
 
@@ -179,9 +304,22 @@ def not_found(error):
     return jsonify({'error': 'Route not found'}), 404
 
 
+# ===========================
+# ✅ Startup: Report Import Time & Kick Off Model Loading
+# ===========================
+startup_timings['import_seconds'] = round(time.perf_counter() - _IMPORT_START, 3)
+print(f"✅ App imported in {startup_timings['import_seconds']}s")
+
+if MODEL_PRELOAD:
+    load_model()  # weights only; warm-up runs per worker after fork
+else:
+    start_model_loader()
+
+
 # ===========================
 # ✅ Run Flask App & Start Monitoring Thread
 # ===========================
 if __name__ == '__main__':
+    start_model_loader()  # no-op unless MODEL_PRELOAD left warm-up pending
     Thread(target=monitor_folder).start()
     app.run(debug=True, port=5000)
\ No newline at end of file
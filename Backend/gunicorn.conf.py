@@ -0,0 +1,26 @@
+# ===========================
+# ✅ Gunicorn Config for Preforked Model Serving
+# ===========================
+# Run from the Backend folder:
+#   gunicorn --preload -c gunicorn.conf.py app:app
+#
+# The parent imports app.py once and loads the YOLOv8 weights (no inference),
+# then forks the workers so they share the weights via copy-on-write. Each
+# worker runs its own warm-up pass and reports ready on /ready.
+import os
+
+os.environ.setdefault("MODEL_PRELOAD", "1")
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("WEB_CONCURRENCY", "2"))
+threads = int(os.environ.get("THREADS", "4"))
+preload_app = True
+
+
+def post_fork(server, worker):
+    # app.py also restarts its loader via os.register_at_fork; this call is
+    # idempotent and keeps the warm-up visible in the gunicorn config.
+    import app
+
+    app.start_model_loader()
+    server.log.info(f"Worker {worker.pid} warming model...")
@@ -1,7 +1,9 @@
-import os
 import time
+_IMPORT_START = time.perf_counter()
+
+import os
+from threading import Lock, Thread
 import cv2
-import onnxruntime as ort
 import numpy as np
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -28,12 +30,34 @@ CLASS_NAMES = {
     12: 'can',
 }
 
-try:
-    session = ort.InferenceSession(MODEL_PATH, providers=['CPUExecutionProvider'])
-    print("ONNX Model Loaded Successfully.")
-except Exception as e:
-    print(f"Error Loading Model: {e}")
-    exit(1)
+_session = None
+_session_error = None
+_session_lock = Lock()
+
+def get_session():
+    """Creates the ONNX session on first use and warms it with a blank frame.
+
+    Returns None if loading failed; the error is remembered so later images
+    don't retry a bad model.
+    """
+    global _session, _session_error
+    with _session_lock:
+        if _session is None and _session_error is None:
+            try:
+                t0 = time.perf_counter()
+                import onnxruntime as ort
+                t1 = time.perf_counter()
+                session = ort.InferenceSession(MODEL_PATH, providers=['CPUExecutionProvider'])
+                t2 = time.perf_counter()
+                session.run(None, {"images": np.zeros((1, 3, 640, 640), dtype=np.float32)})
+                t3 = time.perf_counter()
+                _session = session
+                print(f"ONNX Model Loaded Successfully (import {t1 - t0:.2f}s, "
+                      f"load {t2 - t1:.2f}s, warm-up {t3 - t2:.2f}s).")
+            except Exception as e:
+                _session_error = str(e)
+                print(f"Error Loading Model: {e}")
+    return _session
 
 def preprocess_image(image_path):
     """Loads and preprocesses an image for YOLO inference."""
@@ -111,6 +135,11 @@ def run_yolo(image_path):
     if img is None:
         return "Error in processing image."
 
+    session = get_session()
+    if session is None:
+        print(f"Skipping {image_path}: model unavailable ({_session_error}).")
+        return "Model unavailable."
+
     try:
         outputs = session.run(None, {"images": img})
     except Exception as e:
@@ -194,18 +223,25 @@ class ImageHandler(FileSystemEventHandler):
             result_text = run_yolo(image_path)
             print(f"Results: \n{result_text}")
 
-observer = Observer(timeout=1)  
-event_handler = ImageHandler()
-observer.schedule(event_handler, path=IMAGE_FOLDER, recursive=False)
-
-try:
-    observer.start()
-    print(f"Monitoring folder: {IMAGE_FOLDER} for new images... Press Ctrl+C to stop.")
-    
-    while True:
-        time.sleep(10)  
-except KeyboardInterrupt:
-    print("\nStopping folder monitoring...")
-    observer.stop()
-observer.join()
-print("Monitoring stopped successfully.")
+if __name__ == '__main__':
+    print(f"Imported in {time.perf_counter() - _IMPORT_START:.2f}s.")
+
+    # Watch the folder right away; the model loads in the background and any
+    # image arriving first waits for it inside get_session().
+    Thread(target=get_session, daemon=True).start()
+
+    observer = Observer(timeout=1)
+    event_handler = ImageHandler()
+    observer.schedule(event_handler, path=IMAGE_FOLDER, recursive=False)
+
+    try:
+        observer.start()
+        print(f"Monitoring folder: {IMAGE_FOLDER} for new images... Press Ctrl+C to stop.")
+
+        while True:
+            time.sleep(10)
+    except KeyboardInterrupt:
+        print("\nStopping folder monitoring...")
+        observer.stop()
+    observer.join()
+    print("Monitoring stopped successfully.")